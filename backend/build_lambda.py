@@ -0,0 +1,236 @@
+import os
+import sys
+import json
+import shutil
+import logging
+import zipfile
+import argparse
+import subprocess
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(BACKEND_DIR), 'build')
+
+# Only these modules are shipped; tests, the local server and this script stay out.
+RUNTIME_MODULES = ['main.py']
+RUNTIME_REQUIREMENTS = os.path.join(BACKEND_DIR, 'requirements.txt')
+
+# Must match the runtime of the deployed function (terraform/modules/lambda).
+DEFAULT_PYTHON_VERSION = '3.10'
+DEFAULT_PLATFORM = 'manylinux2014_x86_64'
+DEFAULT_MAX_UNZIPPED_MB = 50
+
+# Fixed metadata so identical inputs always produce a byte-identical zip.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Where Lambda unpacks the function and layer zips.
+LAMBDA_TASK_ROOT = '/var/task'
+LAMBDA_LAYER_ROOT = '/opt'
+
+
+def install_dependencies(target_dir, python_version, platform):
+    """
+    Installs the pinned runtime requirements for the Lambda platform into target_dir.
+    """
+    subprocess.run([
+        sys.executable, '-m', 'pip', 'install',
+        '--quiet',
+        '--requirement', RUNTIME_REQUIREMENTS,
+        '--target', target_dir,
+        '--platform', platform,
+        '--python-version', python_version,
+        '--implementation', 'cp',
+        '--only-binary=:all:',
+        '--no-compile',
+        '--upgrade'
+    ], check=True)
+    prune(target_dir)
+
+
+def prune(directory):
+    """
+    Removes pip's console scripts (directory/bin) and stale bytecode, which are never used inside Lambda.
+    Other directories are left alone, since packages may ship data in directories of any name.
+    """
+    shutil.rmtree(os.path.join(directory, 'bin'), ignore_errors=True)
+    for root, dirs, _ in os.walk(directory):
+        if '__pycache__' in dirs:
+            shutil.rmtree(os.path.join(root, '__pycache__'))
+            dirs.remove('__pycache__')
+
+
+def precompile(directory, python_version, install_dir, invalidation_mode='checked-hash'):
+    """
+    Precompiles every module so the function does not compile on cold start.
+    Hash-based pycs stay valid even though zipping resets every file's mtime, and
+    install_dir (where Lambda unpacks the zip) is recorded as the source path.
+    checked-hash pycs are discarded if the source changes (e.g. main.py edited in the
+    Lambda console); unchecked-hash skips that check and is only safe for code nobody
+    edits in place, such as a layer.
+    Returns False if this interpreter cannot produce bytecode for the target runtime
+    (compiling nothing) or if compileall fails.
+    """
+    current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    if current_version != python_version:
+        logger.warning(
+            f"Skipping precompilation: building with Python {current_version}, "
+            f"but the target runtime is Python {python_version}."
+        )
+        return False
+    # A fixed hash seed keeps set/frozenset constants in the same order on every build.
+    result = subprocess.run([
+        sys.executable, '-m', 'compileall', '-q', '-j', '0',
+        '--invalidation-mode', invalidation_mode,
+        '-d', install_dir, directory
+    ], env={**os.environ, 'PYTHONHASHSEED': '0'}, capture_output=True, text=True)
+    if result.returncode != 0:
+        output = (result.stdout + result.stderr).strip()
+        logger.warning(f"Precompiling {directory} failed:\n{output}")
+        return False
+    return True
+
+
+def directory_size(directory):
+    total = 0
+    for root, _, files in os.walk(directory):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def write_zip(source_dir, zip_path):
+    """
+    Zips source_dir with sorted entries and fixed timestamps and permissions.
+    """
+    entries = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        entries.extend(os.path.join(root, name) for name in sorted(files))
+
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        for path in entries:
+            info = zipfile.ZipInfo(os.path.relpath(path, source_dir).replace(os.sep, '/'), ZIP_DATE_TIME)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, 'rb') as f:
+                archive.writestr(info, f.read(), compresslevel=9)
+
+
+def measure_import_time(function_dir, layer_dir=None):
+    """
+    Imports the handler module in a fresh interpreter and returns the time taken in milliseconds.
+    """
+    path = [function_dir] + ([os.path.join(layer_dir, 'python')] if layer_dir else [])
+    env = {
+        'PATH': os.environ.get('PATH', ''),
+        'PYTHONPATH': os.pathsep.join(path),
+        'PYTHONDONTWRITEBYTECODE': '1',
+        'TABLE_NAME': 'build-check',
+        'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
+    }
+    code = (
+        "import time; start = time.perf_counter(); import main; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], env=env, cwd=function_dir,
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        logger.warning(f"Could not import the handler from the package: {result.stderr.strip()}")
+        return None
+    return float(result.stdout.strip())
+
+
+def build(output_dir=DEFAULT_OUTPUT_DIR, layer=False, include_dependencies=True,
+          python_version=DEFAULT_PYTHON_VERSION, platform=DEFAULT_PLATFORM):
+    """
+    Builds build/lambda_package.zip (and build/lambda_layer.zip when layer=True).
+    Returns a report dict with unzipped/zipped sizes and the handler import time.
+    'precompiled' is False if bytecode was skipped for another runtime or compileall failed.
+    """
+    if layer and not include_dependencies:
+        raise ValueError('A layer needs dependencies; --layer cannot be combined with --no-deps')
+
+    function_dir = os.path.join(output_dir, 'lambda')
+    layer_dir = os.path.join(output_dir, 'layer') if layer else None
+    # Drop earlier outputs too, so a stale layer zip is never deployed alongside a new package.
+    for directory in (function_dir, os.path.join(output_dir, 'layer')):
+        shutil.rmtree(directory, ignore_errors=True)
+    for name in ('lambda_package.zip', 'lambda_layer.zip'):
+        if os.path.exists(os.path.join(output_dir, name)):
+            os.remove(os.path.join(output_dir, name))
+    os.makedirs(function_dir)
+
+    for module in RUNTIME_MODULES:
+        shutil.copy2(os.path.join(BACKEND_DIR, module), function_dir)
+
+    if include_dependencies:
+        # Lambda layers expose python/ on sys.path.
+        install_dependencies(os.path.join(layer_dir, 'python') if layer else function_dir, python_version, platform)
+
+    report = {'precompiled': True, 'artifacts': {}}
+    artifacts = (
+        ('lambda_package', function_dir, LAMBDA_TASK_ROOT, 'checked-hash'),
+        ('lambda_layer', layer_dir, LAMBDA_LAYER_ROOT, 'unchecked-hash')
+    )
+    for name, directory, install_dir, invalidation_mode in artifacts:
+        if not directory:
+            continue
+        precompiled = precompile(directory, python_version, install_dir, invalidation_mode)
+        report['precompiled'] = precompiled and report['precompiled']
+        zip_path = os.path.join(output_dir, f"{name}.zip")
+        write_zip(directory, zip_path)
+        report['artifacts'][name] = {
+            'path': zip_path,
+            'unzipped_bytes': directory_size(directory),
+            'zipped_bytes': os.path.getsize(zip_path)
+        }
+
+    report['unzipped_bytes'] = sum(a['unzipped_bytes'] for a in report['artifacts'].values())
+    report['import_time_ms'] = measure_import_time(function_dir, layer_dir)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build a runtime-only Lambda deployment package.')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--layer', action='store_true', help='Put dependencies in a separate layer zip.')
+    parser.add_argument('--no-deps', action='store_true',
+                        help='Ship only the handler and use the boto3 bundled with the Lambda runtime.')
+    parser.add_argument('--python-version', default=DEFAULT_PYTHON_VERSION)
+    parser.add_argument('--platform', default=DEFAULT_PLATFORM)
+    parser.add_argument('--max-unzipped-mb', type=float, default=DEFAULT_MAX_UNZIPPED_MB,
+                        help='Fail if the function plus layer exceed this unzipped size.')
+    args = parser.parse_args(argv)
+    if args.layer and args.no_deps:
+        parser.error('--layer cannot be combined with --no-deps: the layer would be empty')
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    report = build(args.output_dir, layer=args.layer, include_dependencies=not args.no_deps,
+                   python_version=args.python_version, platform=args.platform)
+
+    for name, artifact in report['artifacts'].items():
+        logger.info(f"{name}: {artifact['unzipped_bytes'] / 1e6:.2f} MB unzipped, "
+                    f"{artifact['zipped_bytes'] / 1e6:.2f} MB zipped -> {artifact['path']}")
+    if report['import_time_ms'] is not None:
+        logger.info(f"Handler import time: {report['import_time_ms']:.1f} ms")
+    logger.info(json.dumps(report))
+
+    # A version mismatch was already warned about; a failure with matching versions is a real error.
+    current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    if not report['precompiled'] and current_version == args.python_version:
+        logger.error("Precompilation failed; see the compileall output above.")
+        return 1
+
+    budget = args.max_unzipped_mb * 1e6
+    if report['unzipped_bytes'] > budget:
+        logger.error(f"Package is {report['unzipped_bytes'] / 1e6:.2f} MB unzipped, "
+                     f"over the {args.max_unzipped_mb} MB budget.")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
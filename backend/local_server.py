@@ -0,0 +1,340 @@
+import json
+import os
+import sys
+import signal
+import logging
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+import boto3
+
+from backend import main
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Header that lets a caller (e.g. a load-testing tool) act as a specific user.
+# It lets any client impersonate any user, so it is ignored unless explicitly trusted.
+SUB_HEADER = 'X-Authorizer-Sub'
+DEFAULT_SUB = os.environ.get('LOCAL_AUTHORIZER_SUB', 'local-user')
+TRUST_SUB_HEADER = os.environ.get('LOCAL_TRUST_SUB_HEADER', '').lower() in ('1', 'true', 'yes')
+
+# Idle keep-alive connections are closed after this many seconds so they don't hold a thread.
+KEEP_ALIVE_TIMEOUT = 5
+# Connections each worker process serves concurrently.
+DEFAULT_THREADS = 16
+
+
+class RequestBodyError(Exception):
+    """
+    Raised when a request body cannot be read; carries the HTTP status to return.
+    """
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def build_event(method, raw_path, headers, body, sub=None):
+    """
+    Translates a plain HTTP request into an API-Gateway-shaped proxy event.
+    Fills pathParameters for /todos/{id} and injects the authorizer claims.sub.
+    """
+    url = urlsplit(raw_path)
+    path = url.path
+    query = dict(parse_qsl(url.query)) or None
+
+    path_parameters = None
+    if path.startswith('/todos/'):
+        todo_id = path[len('/todos/'):]
+        if todo_id:
+            path_parameters = {'id': todo_id}
+
+    request_context = {'httpMethod': method, 'path': path}
+    if sub:
+        request_context['authorizer'] = {'claims': {'sub': sub}}
+
+    return {
+        'httpMethod': method,
+        'path': path,
+        'resource': '/todos/{id}' if path_parameters else path,
+        'headers': dict(headers),
+        'queryStringParameters': query,
+        'pathParameters': path_parameters,
+        'requestContext': request_context,
+        'body': body if body else None,
+        'isBase64Encoded': False
+    }
+
+
+def read_body(content_length, transfer_encoding, read):
+    """
+    Reads and decodes a request body given its headers and a read(n) callable.
+    Raises RequestBodyError for chunked, malformed or non-UTF-8 bodies.
+    """
+    if transfer_encoding and transfer_encoding.strip().lower() != 'identity':
+        raise RequestBodyError(411, 'Content-Length required; chunked bodies are not supported')
+    try:
+        length = int(content_length or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise RequestBodyError(400, 'Invalid Content-Length header')
+    if not length:
+        return None
+    try:
+        return read(length).decode('utf-8')
+    except UnicodeDecodeError:
+        raise RequestBodyError(400, 'Request body must be UTF-8 encoded')
+
+
+def resolve_sub(headers, sub, trust_sub_header):
+    """
+    Returns the claims.sub for a request, honouring SUB_HEADER only when trusted.
+    """
+    if trust_sub_header:
+        return headers.get(SUB_HEADER, sub)
+    return sub
+
+
+def make_wsgi_app(handler=None, sub=DEFAULT_SUB, trust_sub_header=TRUST_SUB_HEADER):
+    """
+    Returns a WSGI application that serves lambda_handler routes.
+    Can be run under any WSGI server, e.g. `gunicorn -w 4 backend.local_server:app`.
+    Set trust_sub_header only for load testing: it lets clients pick their user.
+    """
+    handler = handler or main.lambda_handler
+
+    def app(environ, start_response):
+        headers = {
+            key[5:].replace('_', '-').title(): value
+            for key, value in environ.items() if key.startswith('HTTP_')
+        }
+        if environ.get('CONTENT_TYPE'):
+            headers['Content-Type'] = environ['CONTENT_TYPE']
+
+        raw_path = environ.get('PATH_INFO', '/')
+        if environ.get('QUERY_STRING'):
+            raw_path += '?' + environ['QUERY_STRING']
+
+        try:
+            body = read_body(
+                environ.get('CONTENT_LENGTH'), environ.get('HTTP_TRANSFER_ENCODING'), environ['wsgi.input'].read
+            )
+        except RequestBodyError as e:
+            status_code, response_headers, payload = _error_response(e.status_code, e.message)
+        else:
+            event = build_event(
+                environ['REQUEST_METHOD'], raw_path, headers, body,
+                sub=resolve_sub(headers, sub, trust_sub_header)
+            )
+            status_code, response_headers, payload = _invoke(handler, event)
+        start_response(f"{status_code} {_reason(status_code)}", list(response_headers.items()))
+        return [payload]
+
+    return app
+
+
+def _invoke(handler, event):
+    """
+    Calls the handler and unpacks its proxy response into (status, headers, bytes).
+    """
+    try:
+        response = handler(event, None)
+    except Exception as e:
+        logger.exception(f"Unhandled error in handler for {event['httpMethod']} {event['path']}: {e}")
+        return _error_response(500, 'Internal server error')
+    return _unpack(response)
+
+
+def _error_response(status_code, message):
+    return _unpack({
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': json.dumps({'message': message})
+    })
+
+
+def _unpack(response):
+    payload = (response.get('body') or '').encode('utf-8')
+    headers = {str(k): str(v) for k, v in (response.get('headers') or {}).items()}
+    headers['Content-Length'] = str(len(payload))
+    return response.get('statusCode', 200), headers, payload
+
+
+def _reason(status_code):
+    return BaseHTTPRequestHandler.responses.get(status_code, ('',))[0]
+
+
+class LambdaRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves lambda_handler over HTTP/1.1 with keep-alive, so clients can reuse connections.
+    """
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEP_ALIVE_TIMEOUT
+    handler = None
+    sub = DEFAULT_SUB
+    trust_sub_header = TRUST_SUB_HEADER
+
+    def _dispatch(self):
+        try:
+            body = read_body(
+                self.headers.get('Content-Length'), self.headers.get('Transfer-Encoding'), self.rfile.read
+            )
+        except RequestBodyError as e:
+            # The body was not consumed, so the rest of the stream can't be trusted.
+            self.close_connection = True
+            status_code, headers, payload = _error_response(e.status_code, e.message)
+            headers['Connection'] = 'close'
+        else:
+            event = build_event(
+                self.command, self.path, self.headers.items(), body,
+                sub=resolve_sub(self.headers, self.sub, self.trust_sub_header)
+            )
+            status_code, headers, payload = _invoke(self.handler or main.lambda_handler, event)
+
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_OPTIONS = _dispatch
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class ThreadLocalTable:
+    """
+    Stands in for main.table, giving every thread its own boto3 session and Table resource.
+    boto3 resources and the default session are not thread-safe, so threads must not share them.
+    """
+    def __init__(self, table_name, endpoint_url=None):
+        self._table_name = table_name
+        self._endpoint_url = endpoint_url
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        table = getattr(self._local, 'table', None)
+        if table is None:
+            session = boto3.session.Session()
+            table = session.resource('dynamodb', endpoint_url=self._endpoint_url).Table(self._table_name)
+            self._local.table = table
+        return getattr(table, name)
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that handles connections on a fixed pool of threads. Unlike ThreadingHTTPServer's
+    thread per connection, the threads live on and keep their boto3 session and connection pool.
+    Connections beyond the pool size wait until a thread is free.
+    """
+    threads = DEFAULT_THREADS
+    _executor = None
+
+    def process_request(self, request, client_address):
+        # Created on first use, i.e. inside the forked worker rather than in the parent.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='lambda-http')
+        self._executor.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def _run_worker(server, use_default_handler):
+    """
+    Entry point of each forked worker process.
+    """
+    if use_default_handler:
+        # Replace the resource inherited from the parent so no boto3 state crosses the fork.
+        main.table = ThreadLocalTable(main.TABLE_NAME, os.environ.get('DYNAMODB_ENDPOINT_URL'))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def _terminate(signum, frame):
+    # Ignore further SIGTERMs (e.g. when the whole process group is signalled) while workers are joined.
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    sys.exit(0)
+
+
+def serve(host='127.0.0.1', port=8000, workers=None, handler=None, sub=DEFAULT_SUB,
+          trust_sub_header=TRUST_SUB_HEADER, threads=DEFAULT_THREADS):
+    """
+    Serves lambda_handler on a socket shared by a pool of forked worker processes.
+    backend.main is imported once in the parent and inherited by every worker through fork;
+    each worker then serves up to `threads` connections at once, and each of its threads
+    creates its own boto3 session and Table, so connection pools stay warm per thread.
+    At most workers * threads connections are served concurrently; further connections
+    wait for a free thread (idle keep-alive connections are closed after KEEP_ALIVE_TIMEOUT).
+    """
+    workers = workers or os.cpu_count() or 1
+    request_handler = type('BoundLambdaRequestHandler', (LambdaRequestHandler,), {
+        'handler': staticmethod(handler) if handler else None,
+        'sub': sub,
+        'trust_sub_header': trust_sub_header
+    })
+    server = PooledHTTPServer((host, port), request_handler)
+    server.threads = threads
+    logger.info(
+        f"Serving lambda_handler on http://{host}:{server.server_port} "
+        f"with {workers} worker(s) x {threads} thread(s)"
+    )
+    if trust_sub_header:
+        logger.warning(f"Trusting the {SUB_HEADER} header: any client can act as any user. Use for load testing only.")
+
+    # Workers inherit the already-bound listening socket, so the kernel spreads accepts across them.
+    ctx = multiprocessing.get_context('fork')
+    processes = [
+        ctx.Process(target=_run_worker, args=(server, handler is None), daemon=True) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Turn SIGTERM into a normal exit so the workers are reaped rather than orphaned.
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        logger.info("Shutting down local server.")
+    finally:
+        for process in processes:
+            process.terminate()
+        server.server_close()
+
+
+app = make_wsgi_app()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve lambda_handler over plain HTTP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None, help='Defaults to the number of CPU cores.')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help='Connections each worker serves concurrently.')
+    parser.add_argument('--sub', default=DEFAULT_SUB, help='Authorizer claims.sub injected into every event.')
+    parser.add_argument('--trust-sub-header', action='store_true', default=TRUST_SUB_HEADER,
+                        help=f'Let clients choose claims.sub via {SUB_HEADER}. Load testing only: '
+                             'any client can act as any user.')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.host, args.port, args.workers, sub=args.sub, trust_sub_header=args.trust_sub_header,
+          threads=args.threads)
@@ -0,0 +1,79 @@
+import os
+import sys
+import zipfile
+import pytest
+from backend import build_lambda
+
+
+def current_python_version():
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+def test_build_ships_only_runtime_modules(tmp_path):
+    report = build_lambda.build(
+        str(tmp_path), include_dependencies=False, python_version=current_python_version()
+    )
+    names = zipfile.ZipFile(report['artifacts']['lambda_package']['path']).namelist()
+    assert 'main.py' in names
+    assert any(name.startswith('__pycache__/main.') for name in names)
+    assert not any('test_' in name or 'local_server' in name or 'build_lambda' in name for name in names)
+    assert report['precompiled'] is True
+    assert 'lambda_layer' not in report['artifacts']
+
+def test_build_skips_precompile_for_other_runtime(tmp_path):
+    report = build_lambda.build(str(tmp_path), include_dependencies=False, python_version='2.7')
+    names = zipfile.ZipFile(report['artifacts']['lambda_package']['path']).namelist()
+    assert names == ['main.py']
+    assert report['precompiled'] is False
+
+def test_write_zip_is_reproducible(tmp_path):
+    source = tmp_path / 'src'
+    (source / 'pkg').mkdir(parents=True)
+    (source / 'pkg' / 'b.py').write_text('B = 2\n')
+    (source / 'a.py').write_text('A = 1\n')
+
+    first, second = str(tmp_path / 'first.zip'), str(tmp_path / 'second.zip')
+    build_lambda.write_zip(str(source), first)
+    os.utime(source / 'a.py', (0, 0))  # A different mtime must not change the archive
+    build_lambda.write_zip(str(source), second)
+
+    with open(first, 'rb') as f1, open(second, 'rb') as f2:
+        assert f1.read() == f2.read()
+    assert zipfile.ZipFile(first).namelist() == ['a.py', 'pkg/b.py']
+
+def test_main_enforces_size_budget(tmp_path):
+    args = ['--output-dir', str(tmp_path), '--no-deps', '--python-version', current_python_version()]
+    assert build_lambda.main(args + ['--max-unzipped-mb', '50']) == 0
+    assert build_lambda.main(args + ['--max-unzipped-mb', '0.001']) == 1
+
+def test_build_removes_stale_zips(tmp_path):
+    (tmp_path / 'lambda_layer.zip').write_bytes(b'stale')
+    build_lambda.build(str(tmp_path), include_dependencies=False, python_version='2.7')
+    assert not (tmp_path / 'lambda_layer.zip').exists()
+    assert (tmp_path / 'lambda_package.zip').exists()
+
+def test_layer_requires_dependencies(tmp_path):
+    with pytest.raises(ValueError):
+        build_lambda.build(str(tmp_path), layer=True, include_dependencies=False)
+    with pytest.raises(SystemExit):
+        build_lambda.main(['--output-dir', str(tmp_path), '--layer', '--no-deps'])
+
+def test_prune_keeps_nested_bin_directories(tmp_path):
+    (tmp_path / 'bin').mkdir()
+    (tmp_path / 'pkg' / 'bin').mkdir(parents=True)
+    (tmp_path / 'pkg' / '__pycache__').mkdir()
+    build_lambda.prune(str(tmp_path))
+    assert not (tmp_path / 'bin').exists()
+    assert not (tmp_path / 'pkg' / '__pycache__').exists()
+    assert (tmp_path / 'pkg' / 'bin').exists()
+
+def test_precompile_failure_is_reported(tmp_path, monkeypatch, caplog):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'broken.py').write_text('def broken(:\n')
+    assert build_lambda.precompile(str(tmp_path / 'src'), current_python_version(), '/var/task') is False
+    assert 'broken.py' in caplog.text
+
+    monkeypatch.setattr(build_lambda, 'RUNTIME_MODULES', ['broken.py'])
+    monkeypatch.setattr(build_lambda, 'BACKEND_DIR', str(tmp_path / 'src'))
+    monkeypatch.setattr(build_lambda, 'measure_import_time', lambda *args: None)
+    args = ['--output-dir', str(tmp_path / 'out'), '--no-deps', '--python-version', current_python_version()]
+    assert build_lambda.main(args) == 1
@@ -0,0 +1,179 @@
+import os
+os.environ["TABLE_NAME"] = "TestTable"
+
+import io
+import json
+import threading
+import http.client
+from http.server import HTTPServer
+from unittest.mock import MagicMock
+from backend import local_server
+
+
+def echo_handler(event, context):
+    return {
+        'statusCode': 200,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(event)
+    }
+
+def call_wsgi(app, method, path, body=b'', headers=None):
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body)
+    }
+    for key, value in (headers or {}).items():
+        environ['HTTP_' + key.upper().replace('-', '_')] = value
+    captured = {}
+    def start_response(status, response_headers):
+        captured['status'] = status
+        captured['headers'] = dict(response_headers)
+    payload = b''.join(app(environ, start_response))
+    return captured['status'], captured['headers'], payload
+
+def test_build_event_with_path_parameter():
+    event = local_server.build_event('GET', '/todos/abc?x=1', {}, None, sub='user-123')
+    assert event['httpMethod'] == 'GET'
+    assert event['path'] == '/todos/abc'
+    assert event['pathParameters'] == {'id': 'abc'}
+    assert event['queryStringParameters'] == {'x': '1'}
+    assert event['requestContext']['authorizer']['claims']['sub'] == 'user-123'
+    assert event['body'] is None
+
+def test_build_event_without_sub():
+    event = local_server.build_event('POST', '/todos', {}, '{"task": "A"}')
+    assert event['pathParameters'] is None
+    assert 'authorizer' not in event['requestContext']
+    assert event['body'] == '{"task": "A"}'
+
+def test_wsgi_app_translates_request():
+    app = local_server.make_wsgi_app(handler=echo_handler, sub='user-123')
+    status, headers, payload = call_wsgi(app, 'POST', '/todos', b'{"task": "A"}')
+    assert status == '200 OK'
+    assert headers['Content-Length'] == str(len(payload))
+    event = json.loads(payload)
+    assert event['body'] == '{"task": "A"}'
+    assert event['requestContext']['authorizer']['claims']['sub'] == 'user-123'
+
+def test_wsgi_app_sub_header_override():
+    app = local_server.make_wsgi_app(handler=echo_handler, sub='user-123', trust_sub_header=True)
+    _, _, payload = call_wsgi(app, 'GET', '/todos', headers={'X-Authorizer-Sub': 'user-456'})
+    event = json.loads(payload)
+    assert event['requestContext']['authorizer']['claims']['sub'] == 'user-456'
+
+def test_wsgi_app_sub_header_ignored_by_default():
+    app = local_server.make_wsgi_app(handler=echo_handler, sub='user-123')
+    _, _, payload = call_wsgi(app, 'GET', '/todos', headers={'X-Authorizer-Sub': 'user-456'})
+    event = json.loads(payload)
+    assert event['requestContext']['authorizer']['claims']['sub'] == 'user-123'
+
+def test_wsgi_app_rejects_undecodable_body():
+    handler = MagicMock()
+    app = local_server.make_wsgi_app(handler=handler)
+    status, _, payload = call_wsgi(app, 'POST', '/todos', b'\xff\xfe')
+    assert status == '400 Bad Request'
+    assert "UTF-8" in payload.decode()
+    handler.assert_not_called()
+
+def test_read_body_errors():
+    read = io.BytesIO(b'{}').read
+    for content_length, transfer_encoding, status_code in (('abc', None, 400), ('-1', None, 400), (None, 'chunked', 411)):
+        try:
+            local_server.read_body(content_length, transfer_encoding, read)
+        except local_server.RequestBodyError as e:
+            assert e.status_code == status_code
+        else:
+            assert False, f"Expected RequestBodyError for {content_length!r}, {transfer_encoding!r}"
+
+def test_wsgi_app_handler_error():
+    handler = MagicMock(side_effect=Exception("boom"))
+    app = local_server.make_wsgi_app(handler=handler)
+    status, _, payload = call_wsgi(app, 'GET', '/todos')
+    assert status == '500 Internal Server Error'
+    assert "Internal server error" in payload.decode()
+
+def test_request_handler_keep_alive():
+    request_handler = type('TestHandler', (local_server.LambdaRequestHandler,), {
+        'handler': staticmethod(echo_handler), 'sub': 'user-123'
+    })
+    server = HTTPServer(('127.0.0.1', 0), request_handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+        for todo_id in ('1', '2'):
+            conn.request('DELETE', f'/todos/{todo_id}')
+            response = conn.getresponse()
+            event = json.loads(response.read())
+            assert response.status == 200
+            assert event['pathParameters'] == {'id': todo_id}
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_request_handler_bad_requests():
+    request_handler = type('TestHandler', (local_server.LambdaRequestHandler,), {
+        'handler': staticmethod(echo_handler)
+    })
+    server = HTTPServer(('127.0.0.1', 0), request_handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for headers, status_code in (({'Content-Length': 'abc'}, 400), ({'Transfer-Encoding': 'chunked'}, 411)):
+            conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+            conn.putrequest('POST', '/todos')
+            for key, value in headers.items():
+                conn.putheader(key, value)
+            conn.endheaders()
+            response = conn.getresponse()
+            assert response.status == status_code
+            assert response.getheader('Connection') == 'close'
+            conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_pooled_server_serves_concurrent_keep_alive_connections():
+    request_handler = type('TestHandler', (local_server.LambdaRequestHandler,), {
+        'handler': staticmethod(echo_handler)
+    })
+    server = local_server.PooledHTTPServer(('127.0.0.1', 0), request_handler)
+    server.threads = 2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        # Both connections stay open; the second must not wait for the first to close.
+        connections = [http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=2) for _ in range(2)]
+        for _ in range(2):
+            for conn in connections:
+                conn.request('GET', '/todos')
+                response = conn.getresponse()
+                response.read()
+                assert response.status == 200
+        for conn in connections:
+            conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_thread_local_table_per_thread(monkeypatch):
+    sessions = []
+    def make_session():
+        session = MagicMock()
+        sessions.append(session)
+        return session
+    monkeypatch.setattr(local_server.boto3.session, 'Session', make_session)
+    table = local_server.ThreadLocalTable('TestTable')
+
+    table.get_item(Key={'id': '1'})
+    table.put_item(Item={'id': '1'})
+    worker = threading.Thread(target=lambda: table.get_item(Key={'id': '2'}))
+    worker.start()
+    worker.join()
+
+    assert len(sessions) == 2
+    sessions[0].resource.return_value.Table.assert_called_once_with('TestTable')
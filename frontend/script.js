@@ -73,6 +73,8 @@ function showAppSection(user) {
     authSection.classList.add('hidden');
     appSection.classList.remove('hidden');
     usernameDisplay.textContent = user.attributes?.email || user.username;
+    resetTodoState(); // Never carry a previous session's list or requests into this one
+    loadCachedTodos();
     fetchTodos();
 }
 
@@ -184,8 +186,7 @@ async function handleSignOut() {
         await window.Auth.signOut();
         showMessage('You have been signed out.');
         showAuthSection('signin');
-        todoList.innerHTML = ''; // Clear To-Do list on sign out
-        noTodosMessage.classList.remove('hidden');
+        clearTodoState(); // Clear To-Do list and local cache on sign out
         newTodoTaskInput.value = '';
         signUpEmailInput.value = '';
         signUpPasswordInput.value = '';
@@ -197,11 +198,144 @@ async function handleSignOut() {
     }
 }
 
+// --- Local State ---
+// The list shown to the user is derived from three layers, applied in order:
+//   serverTodos      - last state confirmed by the API (mirrored to IndexedDB)
+//   inFlightMutations - changes sent to the API but not yet acknowledged
+//   pendingMutations  - changes queued locally, waiting for the next flush
+// Each mutation is { type: 'update', changes } or { type: 'delete' }, keyed by todo id.
+const serverTodos = new Map();
+const inFlightMutations = new Map();
+const pendingMutations = new Map();
+const pendingCreates = new Map(); // tempId -> optimistic todo, until POST returns
+const todoElements = new Map(); // todo id -> { element, signature } for incremental rendering
+
+const MUTATION_FLUSH_DELAY_MS = 400; // Coalesce rapid clicks into a single batch
+let flushTimer = null;
+let hasFetchedTodos = false; // Once the API has answered, the cache is no longer needed for display
+
+// Bumped whenever the list is reset (sign-in, sign-out). A response whose request was
+// sent under an earlier generation belongs to another session and is dropped.
+let sessionGeneration = 0;
+
+// Counts confirmed POST/PUT/DELETE responses, so fetchTodos() can tell which todos
+// changed while its GET was in flight and keep those instead of its older snapshot.
+let confirmedMutationCount = 0;
+const confirmedAt = new Map(); // todo id -> confirmedMutationCount when last confirmed
+
+function markConfirmed(id) {
+    confirmedMutationCount += 1;
+    confirmedAt.set(id, confirmedMutationCount);
+}
+
+// --- IndexedDB Cache ---
+// One cache per browser, stamped with the owner's Cognito sub. Any access by a
+// different user wipes the cached todos first, so accounts never see each other's data.
+const CACHE_DB_NAME = 'todo-app';
+const CACHE_DB_VERSION = 1;
+const CACHE_STORE_NAME = 'todos';
+const CACHE_META_STORE_NAME = 'meta';
+let cacheDbPromise = null;
+
+function openCacheDb() {
+    if (!window.indexedDB) {
+        return Promise.resolve(null);
+    }
+    if (!cacheDbPromise) {
+        cacheDbPromise = new Promise((resolve) => {
+            const request = window.indexedDB.open(CACHE_DB_NAME, CACHE_DB_VERSION);
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                db.createObjectStore(CACHE_STORE_NAME, { keyPath: 'id' });
+                db.createObjectStore(CACHE_META_STORE_NAME, { keyPath: 'key' });
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => {
+                console.error('Error opening To-Do cache:', request.error);
+                resolve(null); // The app still works without the cache
+            };
+        });
+    }
+    return cacheDbPromise;
+}
+
+// Runs useStore(todoStore) in a transaction owned by the signed-in user and resolves with its result.
+async function withOwnedCache(useStore) {
+    const owner = currentUserSub;
+    const db = await openCacheDb();
+    if (!db || !owner) {
+        return undefined;
+    }
+    return new Promise((resolve) => {
+        const transaction = db.transaction([CACHE_STORE_NAME, CACHE_META_STORE_NAME], 'readwrite');
+        const todoStore = transaction.objectStore(CACHE_STORE_NAME);
+        const metaStore = transaction.objectStore(CACHE_META_STORE_NAME);
+        let result;
+
+        const ownerRequest = metaStore.get('owner');
+        ownerRequest.onsuccess = () => {
+            if (ownerRequest.result?.value !== owner) {
+                todoStore.clear();
+                metaStore.put({ key: 'owner', value: owner });
+            }
+            const request = useStore(todoStore);
+            if (request) {
+                request.onsuccess = () => { result = request.result; };
+            }
+        };
+        transaction.oncomplete = () => resolve(result);
+        transaction.onerror = () => {
+            console.error('Error accessing To-Do cache:', transaction.error);
+            resolve(undefined);
+        };
+    });
+}
+
+function writeCache(applyChanges) {
+    return withOwnedCache((store) => {
+        applyChanges(store);
+    });
+}
+
+async function readCachedTodos() {
+    return (await withOwnedCache(store => store.getAll())) || [];
+}
+
+async function clearCache() {
+    const db = await openCacheDb();
+    if (!db) {
+        return;
+    }
+    const transaction = db.transaction([CACHE_STORE_NAME, CACHE_META_STORE_NAME], 'readwrite');
+    transaction.objectStore(CACHE_STORE_NAME).clear();
+    transaction.objectStore(CACHE_META_STORE_NAME).clear();
+}
+
 // --- API Interaction Functions ---
+// Refreshed on every getAuthHeaders() call. The page-hide flush uses them
+// directly, because there is no time to await Auth.currentSession() there.
+let currentAuthToken = null;
+let currentAuthTokenExpiresAt = 0; // ms since epoch, from the token's exp claim
+let currentUserSub = null;
+
+const TOKEN_EXPIRY_MARGIN_MS = 60 * 1000;
+
+function hasFreshAuthToken() {
+    return !!currentAuthToken && Date.now() < currentAuthTokenExpiresAt - TOKEN_EXPIRY_MARGIN_MS;
+}
+
+async function refreshSession() {
+    const session = await window.Auth.currentSession();
+    const idToken = session.getIdToken();
+    currentAuthToken = idToken.getJwtToken();
+    currentAuthTokenExpiresAt = idToken.payload.exp * 1000;
+    currentUserSub = idToken.payload.sub;
+}
+
 async function getAuthHeaders() {
     try {
-        const session = await window.Auth.currentSession();
-        return { Authorization: session.getIdToken().getJwtToken() };
+        await refreshSession();
+        return { Authorization: currentAuthToken };
     } catch (e) {
         console.error("Authentication required:", e);
         showMessage('Your session has expired. Please sign in again.', true);
@@ -210,18 +344,51 @@ async function getAuthHeaders() {
     }
 }
 
-function renderTodos(todos) {
-    todoList.innerHTML = ''; // Clear existing list
-    if (todos.length === 0) {
-        noTodosMessage.classList.remove('hidden');
-        return;
+async function apiRequest(method, path, body, action, { keepalive = false, useCachedToken = false } = {}) {
+    // On pagehide, fetch() must start before the page is torn down, so use the last token without awaiting
+    const headers = useCachedToken && hasFreshAuthToken() ? { Authorization: currentAuthToken } : await getAuthHeaders();
+    const response = await fetch(`${API_GATEWAY_URL}${path}`, {
+        method,
+        headers: {
+            'Content-Type': 'application/json',
+            ...headers,
+        },
+        body: body === undefined ? undefined : JSON.stringify(body),
+        keepalive, // Lets a flush started on page hide outlive the page
+    });
+
+    if (!response.ok) {
+        const errorData = await response.json().catch(() => ({ message: 'Unknown error' }));
+        throw new Error(`Error ${action} todo: ${response.status} ${errorData.message || response.statusText}`);
     }
-    noTodosMessage.classList.add('hidden');
+    return response.json();
+}
+
+// Applies queued and in-flight mutations on top of the confirmed server state.
+function currentTodos() {
+    const todos = [];
+    serverTodos.forEach((todo, id) => {
+        const inFlight = inFlightMutations.get(id);
+        const pending = pendingMutations.get(id);
+        if (inFlight?.type === 'delete' || pending?.type === 'delete') {
+            return;
+        }
+        if (inFlight || pending) {
+            todos.push({ ...todo, ...inFlight?.changes, ...pending?.changes, pending: true });
+        } else {
+            todos.push(todo);
+        }
+    });
+    pendingCreates.forEach(todo => todos.push(todo));
+    return todos.sort((a, b) => (a.createdAt || '').localeCompare(b.createdAt || ''));
+}
+
+function todoSignature(todo) {
+    return JSON.stringify([todo.id, todo.task, todo.completed, todo.dueDate, todo.category, todo.priority, !!todo.pending]);
+}
 
-    todos.forEach(todo => {
-        const listItem = document.createElement('li');
-        listItem.className = 'flex items-center justify-between bg-gray-50 p-4 rounded-lg shadow-sm border border-gray-200';
-        listItem.innerHTML = `
+function todoItemHtml(todo) {
+    return `
             <span class="flex-grow text-gray-800 ${todo.completed ? 'line-through text-gray-500' : ''}">
                 ${todo.task}
                 ${todo.dueDate ? `<span class="ml-2 text-xs text-gray-400"> (Due: ${new Date(todo.dueDate).toLocaleDateString()})</span>` : ''}
@@ -233,7 +400,7 @@ function renderTodos(todos) {
                     class="toggle-completed-button p-2 rounded-full transition duration-150 ease-in-out ${todo.completed ? 'bg-green-500 hover:bg-green-600' : 'bg-yellow-500 hover:bg-yellow-600'} text-white shadow-md"
                     title="${todo.completed ? 'Mark as Incomplete' : 'Mark as Complete'}"
                     data-todo-id="${todo.id}"
-                    data-todo-completed="${todo.completed}"
+                    ${todo.temporary ? 'disabled' : ''}
                 >
                     <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" viewBox="0 0 20 20" fill="currentColor">
                         ${todo.completed ? `
@@ -245,6 +412,7 @@ function renderTodos(todos) {
                     class="delete-todo-button p-2 bg-red-500 text-white rounded-full hover:bg-red-600 focus:outline-none focus:ring-2 focus:ring-red-500 focus:ring-offset-2 transition duration-150 ease-in-out shadow-md"
                     title="Delete To-Do"
                     data-todo-id="${todo.id}"
+                    ${todo.temporary ? 'disabled' : ''}
                 >
                     <svg xmlns="http://www.w3.org/2000/svg" class="h-5 w-5" viewBox="0 0 20 20" fill="currentColor">
                         <path fill-rule="evenodd" d="M9 2a1 1 0 00-.894.553L7.382 4H4a1 1 0 000 2v10a2 2 0 002 2h8a2 2 0 002-2V6a1 1 0 100-2h-3.382l-.724-1.447A1 1 0 0011 2H9zM7 8a1 1 0 012 0v6a1 1 0 11-2 0V8zm6 0a1 1 0 11-2 0v6a1 1 0 112 0V8z" clip-rule="evenodd" />
@@ -252,46 +420,116 @@ function renderTodos(todos) {
                 </button>
             </div>
         `;
-        todoList.appendChild(listItem);
-    });
+}
 
-    // Add event listeners to newly rendered buttons
-    document.querySelectorAll('.toggle-completed-button').forEach(button => {
-        button.addEventListener('click', (event) => {
-            const id = event.currentTarget.dataset.todoId;
-            const completed = event.currentTarget.dataset.todoCompleted === 'true'; // Convert string to boolean
-            updateTodo(id, completed);
-        });
+// Diffs the list against the existing <li> elements and only touches the ones that changed.
+function renderTodos(todos = currentTodos()) {
+    noTodosMessage.classList.toggle('hidden', todos.length > 0);
+
+    const visibleIds = new Set(todos.map(todo => todo.id));
+    todoElements.forEach((entry, id) => {
+        if (!visibleIds.has(id)) {
+            entry.element.remove();
+            todoElements.delete(id);
+        }
     });
 
-    document.querySelectorAll('.delete-todo-button').forEach(button => {
-        button.addEventListener('click', (event) => {
-            const id = event.currentTarget.dataset.todoId;
-            deleteTodo(id);
-        });
+    todos.forEach((todo, index) => {
+        let entry = todoElements.get(todo.id);
+        if (!entry) {
+            const listItem = document.createElement('li');
+            listItem.className = 'flex items-center justify-between bg-gray-50 p-4 rounded-lg shadow-sm border border-gray-200';
+            entry = { element: listItem, signature: null };
+            todoElements.set(todo.id, entry);
+        }
+
+        const signature = todoSignature(todo);
+        if (entry.signature !== signature) {
+            entry.element.innerHTML = todoItemHtml(todo);
+            entry.element.classList.toggle('opacity-60', !!todo.pending);
+            entry.signature = signature;
+        }
+
+        if (todoList.children[index] !== entry.element) {
+            todoList.insertBefore(entry.element, todoList.children[index] || null);
+        }
     });
 }
 
+function resetTodoState() {
+    sessionGeneration += 1;
+    clearTimeout(flushTimer);
+    flushTimer = null;
+    hasFetchedTodos = false;
+    confirmedAt.clear();
+    serverTodos.clear();
+    inFlightMutations.clear();
+    pendingMutations.clear();
+    pendingCreates.clear();
+    todoElements.clear();
+    todoList.innerHTML = '';
+    noTodosMessage.classList.remove('hidden');
+}
+
+function clearTodoState() {
+    resetTodoState();
+    currentAuthToken = null;
+    currentAuthTokenExpiresAt = 0;
+    currentUserSub = null;
+    clearCache();
+}
+
+async function loadCachedTodos() {
+    try {
+        await refreshSession(); // The cache is only read for a known owner
+    } catch (e) {
+        return; // fetchTodos() reports the expired session
+    }
+    const generation = sessionGeneration;
+    const cached = await readCachedTodos();
+    if (!hasFetchedTodos && generation === sessionGeneration && cached.length > 0) {
+        cached.forEach(todo => serverTodos.set(todo.id, todo));
+        renderTodos(); // Show the cached list immediately; fetchTodos() reconciles it
+    }
+}
+
 async function fetchTodos() {
     showMessage(''); // Clear previous messages
+    const generation = sessionGeneration;
+    const fetchStartedAt = confirmedMutationCount;
     try {
-        const headers = await getAuthHeaders();
-        const response = await fetch(`${API_GATEWAY_URL}`, {
-            method: 'GET',
-            headers: {
-                'Content-Type': 'application/json',
-                ...headers,
-            },
-        });
-
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({ message: 'Unknown error' }));
-            throw new Error(`Error fetching todos: ${response.status} ${errorData.message || response.statusText}`);
+        const data = await apiRequest('GET', '', undefined, 'fetching');
+        if (generation !== sessionGeneration) {
+            return; // Signed out (or another user signed in) while the request was in flight
         }
+        hasFetchedTodos = true;
+
+        // Take the snapshot, except for todos a POST/PUT/DELETE confirmed after the GET was
+        // sent: for those the local state is newer (and absent if they were deleted).
+        const changedSinceFetch = id => (confirmedAt.get(id) || 0) > fetchStartedAt;
+        const merged = new Map();
+        data.forEach(todo => {
+            if (!changedSinceFetch(todo.id)) {
+                merged.set(todo.id, todo);
+            }
+        });
+        serverTodos.forEach((todo, id) => {
+            if (changedSinceFetch(id)) {
+                merged.set(id, todo);
+            }
+        });
 
-        const data = await response.json();
-        renderTodos(data);
+        serverTodos.clear();
+        merged.forEach((todo, id) => serverTodos.set(id, todo));
+        writeCache(store => {
+            store.clear();
+            merged.forEach(todo => store.put(todo));
+        });
+        renderTodos();
     } catch (error) {
+        if (generation !== sessionGeneration) {
+            return;
+        }
         console.error('Error fetching todos:', error);
         showMessage(`Error fetching To-Dos: ${error.message}`, true);
     }
@@ -305,76 +543,153 @@ async function createTodo() {
         return;
     }
 
-    try {
-        const headers = await getAuthHeaders();
-        const response = await fetch(`${API_GATEWAY_URL}`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                ...headers,
-            },
-            body: JSON.stringify({ task: task }), // Only sending task for simplicity
-        });
+    // Show the new item straight away; it is swapped for the stored item once POST returns.
+    const tempId = `temp-${Date.now()}-${Math.random().toString(36).slice(2)}`;
+    pendingCreates.set(tempId, {
+        id: tempId,
+        task: task,
+        completed: false,
+        createdAt: new Date().toISOString(),
+        pending: true,
+        temporary: true,
+    });
+    newTodoTaskInput.value = ''; // Clear input
+    renderTodos();
 
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({ message: 'Unknown error' }));
-            throw new Error(`Error creating todo: ${response.status} ${errorData.message || response.statusText}`);
+    const generation = sessionGeneration;
+    try {
+        const item = await apiRequest('POST', '', { task: task }, 'creating'); // Only sending task for simplicity
+        if (generation !== sessionGeneration) {
+            return; // Signed out while the request was in flight; the list was already reset
+        }
+        serverTodos.set(item.id, item);
+        markConfirmed(item.id);
+        writeCache(store => store.put(item));
+        // Reuse the optimistic <li> for the stored item instead of rebuilding it
+        const entry = todoElements.get(tempId);
+        if (entry) {
+            todoElements.delete(tempId);
+            todoElements.set(item.id, entry);
         }
-
-        newTodoTaskInput.value = ''; // Clear input
         showMessage('To-Do created successfully!');
-        fetchTodos(); // Re-fetch to update the list
     } catch (error) {
+        if (generation !== sessionGeneration) {
+            return;
+        }
         console.error('Error creating todo:', error);
         showMessage(`Error creating To-Do: ${error.message}`, true);
+    } finally {
+        if (generation === sessionGeneration) {
+            pendingCreates.delete(tempId);
+            renderTodos();
+        }
     }
 }
 
-async function updateTodo(id, currentCompleted) {
-    showMessage('');
-    try {
-        const headers = await getAuthHeaders();
-        const response = await fetch(`${API_GATEWAY_URL}/${id}`, {
-            method: 'PUT',
-            headers: {
-                'Content-Type': 'application/json',
-                ...headers,
-            },
-            body: JSON.stringify({ completed: !currentCompleted }), // Toggle completed status
-        });
+function updateTodo(id) {
+    const todo = currentTodos().find(item => item.id === id);
+    if (!todo) {
+        return;
+    }
+    const completed = !todo.completed; // Toggle completed status
 
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({ message: 'Unknown error' }));
-            throw new Error(`Error updating todo: ${response.status} ${errorData.message || response.statusText}`);
-        }
+    // Compare against what the API will hold once in-flight requests land. If the
+    // item is being toggled back to that state, drop the queued change entirely.
+    const confirmed = { ...serverTodos.get(id), ...inFlightMutations.get(id)?.changes };
+    if (confirmed.completed === completed) {
+        pendingMutations.delete(id);
+    } else {
+        pendingMutations.set(id, { type: 'update', changes: { completed } });
+    }
+    renderTodos();
+    scheduleFlush();
+}
 
-        showMessage('To-Do updated successfully!');
-        fetchTodos(); // Re-fetch to update the list
-    } catch (error) {
-        console.error('Error updating todo:', error);
-        showMessage(`Error updating To-Do: ${error.message}`, true);
+function deleteTodo(id) {
+    if (!serverTodos.has(id)) {
+        return;
     }
+    pendingMutations.set(id, { type: 'delete' }); // Replaces any queued update for this item
+    renderTodos();
+    scheduleFlush();
 }
 
-async function deleteTodo(id) {
-    showMessage('');
-    try {
-        const headers = await getAuthHeaders();
-        const response = await fetch(`${API_GATEWAY_URL}/${id}`, {
-            method: 'DELETE',
-            headers: headers,
-        });
+function scheduleFlush() {
+    clearTimeout(flushTimer);
+    flushTimer = setTimeout(flushMutations, MUTATION_FLUSH_DELAY_MS);
+}
+
+// Sends the queued mutations as one batch. The API has no batch endpoint, so a
+// batch is a set of concurrent single-item requests. A todo with a request still
+// in flight keeps its mutation queued until that request settles, so requests for
+// one todo reach the API one at a time and in order. Failed mutations are simply
+// dropped, which reverts the item to its last confirmed state. Pass useCachedToken
+// only when there is no time to refresh the session (pagehide).
+async function flushMutations(keepalive = false, useCachedToken = false) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+    const batch = Array.from(pendingMutations.entries()).filter(([id]) => !inFlightMutations.has(id));
+    if (batch.length === 0) {
+        return;
+    }
 
-        if (!response.ok) {
-            const errorData = await response.json().catch(() => ({ message: 'Unknown error' }));
-            throw new Error(`Error deleting todo: ${response.status} ${errorData.message || response.statusText}`);
+    const generation = sessionGeneration;
+    batch.forEach(([id, mutation]) => {
+        pendingMutations.delete(id);
+        inFlightMutations.set(id, mutation);
+    });
+
+    const results = await Promise.allSettled(batch.map(([id, mutation]) =>
+        sendMutation(id, mutation, { keepalive, useCachedToken }).finally(() => {
+            inFlightMutations.delete(id);
+            if (pendingMutations.has(id)) {
+                scheduleFlush(); // Send whatever was queued behind this request
+            }
+        })
+    ));
+
+    if (generation !== sessionGeneration) {
+        return; // Signed out while the batch was in flight
+    }
+
+    const errors = [];
+    let deletedCount = 0;
+    results.forEach((result, index) => {
+        const [id, mutation] = batch[index];
+        if (result.status === 'rejected') {
+            console.error(`Error syncing todo ${id}:`, result.reason);
+            errors.push(result.reason.message);
+        } else if (mutation.type === 'delete') {
+            deletedCount += 1;
         }
+    });
 
+    renderTodos();
+    if (errors.length > 0) {
+        showMessage(`Error saving To-Do changes: ${errors[0]}`, true);
+    } else if (deletedCount > 0) {
         showMessage('To-Do deleted successfully!');
-        fetchTodos(); // Re-fetch to update the list
-    } catch (error) {
-        console.error('Error deleting todo:', error);
-        showMessage(`Error deleting To-Do: ${error.message}`, true);
+    }
+}
+
+async function sendMutation(id, mutation, options) {
+    const generation = sessionGeneration;
+    if (mutation.type === 'delete') {
+        await apiRequest('DELETE', `/${id}`, undefined, 'deleting', options);
+        if (generation !== sessionGeneration) {
+            return; // Signed out while the request was in flight
+        }
+        serverTodos.delete(id);
+        markConfirmed(id);
+        writeCache(store => store.delete(id));
+    } else {
+        const item = await apiRequest('PUT', `/${id}`, mutation.changes, 'updating', options);
+        if (generation !== sessionGeneration || !serverTodos.has(id)) {
+            return; // Deleted or signed out while the request was in flight
+        }
+        serverTodos.set(id, item);
+        markConfirmed(id);
+        writeCache(store => store.put(item));
     }
 }
 
@@ -398,4 +713,29 @@ newTodoTaskInput.addEventListener('keypress', (event) => {
     if (event.key === 'Enter') {
         createTodo();
     }
-});
\ No newline at end of file
+});
+
+// One delegated listener instead of re-binding every button on each render
+todoList.addEventListener('click', (event) => {
+    const button = event.target.closest('button[data-todo-id]');
+    if (!button || button.disabled) {
+        return;
+    }
+    const id = button.dataset.todoId;
+    if (button.classList.contains('toggle-completed-button')) {
+        updateTodo(id);
+    } else if (button.classList.contains('delete-todo-button')) {
+        deleteTodo(id);
+    }
+});
+
+// Send anything still queued before the page goes away. visibilitychange fires
+// earlier and more reliably than pagehide (notably on mobile) and leaves time to
+// refresh the session; pagehide can't wait, so it falls back to the cached token
+// while that is still valid. Whichever fires second finds nothing queued.
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+        flushMutations(true);
+    }
+});
+window.addEventListener('pagehide', () => flushMutations(true, true));
@@ -31,9 +31,11 @@ module "api_gateway" {
 }
 # Reference the Lambda function from modules/lambda
 module "lambda_function" {
-  source         = "./modules/lambda" # Path to the Lambda module
-  project_name   = var.project_name   # Use the project name
-  lambda_handler = var.lambda_handler # Lambda handler (e.g., "lambda_function.lambda_handler")
+  source                = "./modules/lambda"        # Path to the Lambda module
+  project_name          = var.project_name          # Use the project name
+  lambda_handler        = var.lambda_handler        # Lambda handler (e.g., "main.lambda_handler")
+  lambda_zip_path       = var.lambda_zip_path       # Package built by backend/build_lambda.py
+  lambda_layer_zip_path = var.lambda_layer_zip_path # Optional dependency layer
   # runtime = var.lambda_runtime # Lambda runtime (e.g., "python3.9") -- Removed because not expected by the module
   lambda_role_arn     = module.lambda_iam.lambda_role_arn # Pass the IAM role ARN to the Lambda module
   dynamodb_table_name = var.dynamodb_table_name           # Pass the DynamoDB table name as an environment variable
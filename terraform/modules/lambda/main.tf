@@ -1,10 +1,13 @@
 # modules/lambda/main.tf
 
-data "archive_file" "lambda_zip" {
-  type        = "zip"
-  source_dir  = "../../backend/"                                                 # This path assumes lambda_function.py and requirements.txt are in the parent directory of this module
-  output_path = "lambda_package.zip"                                                # Output ZIP file name
-  excludes    = ["terraform", ".terraform", "*.tf", "*.tfvars", "*.zip", "modules"] # Exclude Terraform files
+# The deployment package is built by backend/build_lambda.py (runtime-only, precompiled, size-checked).
+# Dependencies can optionally be shipped as a separate layer (build_lambda.py --layer).
+resource "aws_lambda_layer_version" "dependencies" {
+  count               = var.lambda_layer_zip_path == "" ? 0 : 1
+  layer_name          = "${var.project_name}-dependencies"
+  filename            = var.lambda_layer_zip_path
+  source_code_hash    = filebase64sha256(var.lambda_layer_zip_path) # Publish a new version on dependency changes
+  compatible_runtimes = [var.lambda_runtime]
 }
 
 resource "aws_lambda_function" "todo_function" {
@@ -12,8 +15,9 @@ resource "aws_lambda_function" "todo_function" {
   handler          = var.lambda_handler
   runtime          = var.lambda_runtime
   role             = var.lambda_role_arn
-  filename         = data.archive_file.lambda_zip.output_path
-  source_code_hash = data.archive_file.lambda_zip.output_base64sha256 # Trigger redeploy on code changes
+  filename         = var.lambda_zip_path
+  source_code_hash = filebase64sha256(var.lambda_zip_path) # Trigger redeploy on code changes
+  layers           = aws_lambda_layer_version.dependencies[*].arn
   timeout          = var.lambda_timeout
   memory_size      = var.lambda_function_memory_size
 
@@ -58,7 +62,16 @@ variable "project_name" {
 variable "lambda_handler" {
   description = "The handler for the Lambda function"
   type        = string
-  default     = "lambda_function.lambda_handler" # Default to lambda_function.py
+  default     = "main.lambda_handler" # Handler in backend/main.py
+}
+variable "lambda_zip_path" {
+  description = "Path to the function package built by backend/build_lambda.py"
+  type        = string
+}
+variable "lambda_layer_zip_path" {
+  description = "Path to the dependency layer built by backend/build_lambda.py --layer (empty for no layer)"
+  type        = string
+  default     = ""
 }
 variable "lambda_runtime" {
   description = "The runtime for the Lambda function"
@@ -24,9 +24,9 @@ variable "dynamodb_table_name" {
 }
 
 variable "lambda_handler" {
-  description = "The handler function for the Lambda (e.g., lambda_function.lambda_handler)."
+  description = "The handler function for the Lambda (e.g., main.lambda_handler)."
   type        = string
-  default     = "lambda_function.lambda_handler"
+  default     = "main.lambda_handler"
 }
 
 variable "lambda_runtime" {
@@ -66,7 +66,12 @@ variable "lambda_function_environment_variables" {
 variable "lambda_zip_path" {
   description = "The path to the Lambda function ZIP file."
   type        = string
-  default     = "lambda_package.zip" # Default to the output path of the archive_file data source
+  default     = "../build/lambda_package.zip" # Output of backend/build_lambda.py
+}
+variable "lambda_layer_zip_path" {
+  description = "The path to the Lambda dependency layer ZIP file (empty to ship dependencies in the function package)."
+  type        = string
+  default     = "" # Set to "../build/lambda_layer.zip" after building with --layer
 }
 variable "identity_pool_id" {
   description = "The Cognito Identity Pool ID"